@@ -0,0 +1,61 @@
+# benchmarks/bench_batch_scoring.py
+"""
+Tek tek analiz ile toplu analizin kelime/saniye cinsinden verimini karşılaştırır.
+Sentetik kısa kayıtlar geçici bir klasöre yazılır.
+Kullanım: python -m benchmarks.bench_batch_scoring
+"""
+
+import os
+import time
+import tempfile
+import numpy as np
+import soundfile as sf
+from src.analysis.pronunciation_analyzer import PronunciationAnalyzer
+
+SENTENCES = [
+    "merhaba benim adım ismail",
+    "bugün hava çok güzel",
+    "okula otobüsle gidiyorum",
+    "türkçe öğrenmek eğlenceli",
+]
+
+
+def make_recordings(folder, count, sample_rate=44100):
+    """Rastgele uzunlukta sentetik kayıtlar üretir"""
+    rng = np.random.default_rng(0)
+    items = []
+    for i in range(count):
+        duration = rng.uniform(1.5, 4.0)
+        t = np.arange(int(duration * sample_rate)) / sample_rate
+        y = 0.3 * np.sin(2 * np.pi * rng.uniform(300, 900) * t) + 0.05 * rng.standard_normal(len(t))
+        path = os.path.join(folder, f"kayit_{i:03d}.wav")
+        sf.write(path, y.astype(np.float32), sample_rate)
+        text = SENTENCES[i % len(SENTENCES)]
+        items.append((path, text, text))
+    return items
+
+
+def main(count=40):
+    analyzer = PronunciationAnalyzer()
+    with tempfile.TemporaryDirectory() as folder:
+        items = make_recordings(folder, count)
+        words = sum(len(target.split()) for _, target, _ in items)
+
+        start = time.perf_counter()
+        single = [analyzer.analyze_pronunciation(*item) for item in items]
+        single_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch = analyzer.analyze_pronunciation_batch(items)
+        batch_time = time.perf_counter() - start
+
+    max_diff = max(
+        abs(a['total_score'] - b['total_score']) for a, b in zip(single, batch)
+    )
+    print(f"tek tek: {words / single_time:8.1f} kelime/s")
+    print(f"toplu:   {words / batch_time:8.1f} kelime/s")
+    print(f"en büyük skor farkı: {max_diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
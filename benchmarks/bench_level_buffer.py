@@ -0,0 +1,87 @@
+# benchmarks/bench_level_buffer.py
+"""
+LevelBuffer.push maliyetini ölçer ve ses geri çağrısının gerçek zamanlı
+bütçesiyle (blok süresi) karşılaştırır. Ayrıca seviye göstergesi ve dalga formu
+widget'larının ekran dışı çizim süresini kare başına raporlar.
+Kullanım: python -m benchmarks.bench_level_buffer
+"""
+
+import os
+import time
+import numpy as np
+from src.audio.level_buffer import LevelBuffer
+
+
+def bench_push(block_size=512, sample_rate=44100, seconds=60):
+    """Belirtilen süre kadar sesi bloklar halinde tampona yazar"""
+    level_buffer = LevelBuffer(samples_per_column=sample_rate // 100)
+    rng = np.random.default_rng(0)
+    block = (rng.standard_normal((block_size, 1)) * 0.3).astype(np.float32)
+    blocks = sample_rate * seconds // block_size
+
+    start = time.perf_counter()
+    for _ in range(blocks):
+        level_buffer.push(block[:, 0])
+    elapsed = time.perf_counter() - start
+
+    per_block_us = elapsed / blocks * 1e6
+    budget_us = block_size / sample_rate * 1e6
+    print(f"blok={block_size:5d}  push={per_block_us:7.2f} us  "
+          f"bütçe={budget_us:8.1f} us  oran={per_block_us / budget_us * 100:5.2f}%")
+
+
+def bench_read(capacity=2048, width=800, reads=10000):
+    """Arayüzün her karede yaptığı okumayı ölçer"""
+    level_buffer = LevelBuffer(capacity=capacity)
+    level_buffer.push(np.zeros(capacity * level_buffer.samples_per_column, dtype=np.float32))
+    out_mins = np.zeros(width, dtype=np.float32)
+    out_maxs = np.zeros(width, dtype=np.float32)
+
+    start = time.perf_counter()
+    for _ in range(reads):
+        level_buffer.read_columns(out_mins, out_maxs)
+    elapsed = time.perf_counter() - start
+    print(f"okuma ({width} sütun): {elapsed / reads * 1e6:.2f} us/kare")
+
+
+def bench_render(width=800, height=120, frames=300):
+    """Dalga formu ve seviye göstergesinin 30 fps'lik kare bütçesine göre çizim süresini ölçer"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtGui import QPixmap
+    from src.gui.widgets import LevelMeterWidget, WaveformWidget
+
+    app = QApplication.instance() or QApplication([])
+
+    level_buffer = LevelBuffer()
+    rng = np.random.default_rng(0)
+    level_buffer.push((rng.standard_normal(level_buffer.capacity * level_buffer.samples_per_column)
+                       * 0.3).astype(np.float32))
+
+    waveform = WaveformWidget(capacity=level_buffer.capacity)
+    waveform.resize(width, height)
+    meter = LevelMeterWidget()
+    meter.resize(width, 18)
+    waveform_pixmap = QPixmap(width, height)
+    meter_pixmap = QPixmap(width, 18)
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        waveform.refresh(level_buffer)
+        waveform.render(waveform_pixmap)
+        meter.set_level(0.5, False)
+        meter.render(meter_pixmap)
+    elapsed = time.perf_counter() - start
+
+    per_frame_ms = elapsed / frames * 1e3
+    budget_ms = 1000 / 30
+    print(f"çizim ({width}x{height} px): {per_frame_ms:.2f} ms/kare  "
+          f"bütçe={budget_ms:.1f} ms  oran={per_frame_ms / budget_ms * 100:5.2f}%")
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    for size in (128, 512, 1024, 4096):
+        bench_push(block_size=size)
+    bench_read()
+    bench_render()
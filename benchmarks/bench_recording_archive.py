@@ -0,0 +1,52 @@
+# benchmarks/bench_recording_archive.py
+"""
+Arşivde bir kelime aralığını okumak ile tüm dosyayı çözmeyi karşılaştırır
+ve FLAC dosyasının WAV'a göre boyutunu raporlar.
+Kullanım: python -m benchmarks.bench_recording_archive
+"""
+
+import os
+import time
+import tempfile
+import numpy as np
+import soundfile as sf
+from src.audio.recording_archive import RecordingArchive
+
+
+def main(duration=120, span=0.6, reads=200):
+    rng = np.random.default_rng(0)
+    sample_rate = 44100
+    t = np.arange(duration * sample_rate) / sample_rate
+    y = (0.3 * np.sin(2 * np.pi * 220 * t) * (np.sin(2 * np.pi * 0.5 * t) > 0)
+         + 0.01 * rng.standard_normal(len(t))).astype(np.float32)
+
+    with tempfile.TemporaryDirectory() as folder:
+        wav_path = os.path.join(folder, "kayit.wav")
+        sf.write(wav_path, y, sample_rate, subtype="PCM_16")
+
+        archive = RecordingArchive(root=os.path.join(folder, "recordings"))
+        path = archive.add(y, sample_rate, name="kayit.flac")
+        name = os.path.basename(path)
+        entry = archive.get_entry(name)
+
+        starts = rng.uniform(0, duration - span, reads)
+
+        start = time.perf_counter()
+        for s in starts:
+            archive.read(name, s, s + span)
+        range_time = (time.perf_counter() - start) / reads
+
+        start = time.perf_counter()
+        for _ in range(10):
+            archive.read(name)
+        full_time = (time.perf_counter() - start) / 10
+
+        print(f"WAV (44.1 kHz): {os.path.getsize(wav_path) / 1e6:6.2f} MB")
+        print(f"FLAC (16 kHz):  {os.path.getsize(path) / 1e6:6.2f} MB")
+        print(f"sesli bölge sayısı: {len(entry['voiced_regions'])}")
+        print(f"{span} s aralık okuma: {range_time * 1e3:6.2f} ms")
+        print(f"tüm dosyayı çözme:   {full_time * 1e3:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
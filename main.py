@@ -9,6 +9,7 @@ import os
 from PyQt5.QtWidgets import QApplication
 from src.audio.audio_recorder import AudioRecorder
 from src.audio.speech_recognizer import SpeechRecognizer
+from src.audio.recording_archive import RecordingArchive
 from src.analysis.pronunciation_analyzer import PronunciationAnalyzer
 from src.gui.main_window import MainWindow
 
@@ -40,7 +41,7 @@ def main():
         app = QApplication(sys.argv)
 
         # Temel bileşenleri oluştur
-        audio_recorder = AudioRecorder()
+        audio_recorder = AudioRecorder(archive=RecordingArchive())
         speech_recognizer = SpeechRecognizer()
         pronunciation_analyzer = PronunciationAnalyzer()
 
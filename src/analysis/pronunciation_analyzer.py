@@ -19,6 +19,8 @@ class PronunciationAnalyzer:
             'ö': {'frequency_range': (400, 600), 'common_errors': ['o', 'u']},
             'ı': {'frequency_range': (300, 500), 'common_errors': ['i', 'e']}
         }
+        # Toplu analizde fonemin enerji oranı dizisindeki sütunu
+        self.phoneme_index = {char: i for i, char in enumerate(self.turkish_phonemes)}
 
     def analyze_pronunciation(self, audio_path, target_text, recognized_text):
         """
@@ -35,22 +37,83 @@ class PronunciationAnalyzer:
             # Kelime bazlı analiz
             word_analysis = self._analyze_words(target_words, recognized_words, y, sr)
 
-            # Genel skor hesapla
-            total_score = np.mean([w['score'] for w in word_analysis])
-
-            # Geri bildirim oluştur
-            feedback = self._generate_detailed_feedback(word_analysis)
-
-            return {
-                'total_score': total_score,
-                'word_analysis': word_analysis,
-                'feedback': feedback
-            }
+            return self._build_result(word_analysis)
 
         except Exception as e:
             print(f"Telaffuz analizi hatası: {str(e)}")
             return None
 
+    def analyze_pronunciation_batch(self, items, batch_size=64, max_batch_samples=1 << 21):
+        """
+        Birden çok kaydı toplu olarak analiz eder.
+        items: (audio_path, target_text, recognized_text) demetlerinden oluşan liste.
+        Tüm kayıtlardaki kelime segmentleri uzunluklarına göre gruplanır ve
+        spektrogramlar tek seferde hesaplanır. Her kayıt için analyze_pronunciation
+        ile aynı biçimde sonuç (hata durumunda None) döndürür.
+        batch_size bir STFT çağrısındaki en fazla segment sayısı, max_batch_samples
+        ise dolgu dahil en fazla örnek sayısıdır; bellek kullanımı bu ikisinden
+        küçük olanla sınırlanır.
+        """
+        jobs = []  # Her kayıt için (hedef kelimeler, tanınan kelimeler, ilk segment indeksi, segment sayısı)
+        segments = []
+        sample_rates = []
+
+        for audio_path, target_text, recognized_text in items:
+            try:
+                y, sr = librosa.load(audio_path, sr=None)
+                target_words = self._clean_and_split_text(target_text)
+                recognized_words = self._clean_and_split_text(recognized_text)
+                word_segments = self._segment_audio(y, sr, len(recognized_words))
+
+                # Tek kayıttaki gibi yalnızca hedef kelimesi olan segmentler kullanılır
+                word_segments = word_segments[:len(target_words)]
+                jobs.append((target_words, recognized_words, len(segments), len(word_segments)))
+                segments.extend(word_segments)
+                sample_rates.extend([sr] * len(word_segments))
+
+            except Exception as e:
+                print(f"Telaffuz analizi hatası ({audio_path}): {str(e)}")
+                jobs.append(None)
+
+        # Segment x fonem enerji oranları
+        band_ratios = self._batch_band_ratios(segments, sample_rates, batch_size, max_batch_samples)
+
+        results = []
+        for job in jobs:
+            if job is None:
+                results.append(None)
+                continue
+
+            target_words, recognized_words, first, count = job
+            try:
+                word_analysis = []
+                for i, target in enumerate(target_words[:count]):
+                    recognized = recognized_words[i] if i < len(recognized_words) else ""
+                    phonetic_score = self._phonetic_score_from_bands(target, band_ratios[first + i])
+                    word_analysis.append(self._score_word(target, recognized, phonetic_score))
+
+                results.append(self._build_result(word_analysis))
+
+            except Exception as e:
+                print(f"Telaffuz analizi hatası: {str(e)}")
+                results.append(None)
+
+        return results
+
+    def _build_result(self, word_analysis):
+        """Kelime analizlerinden genel sonucu oluşturur"""
+        # Genel skor hesapla
+        total_score = np.mean([w['score'] for w in word_analysis])
+
+        # Geri bildirim oluştur
+        feedback = self._generate_detailed_feedback(word_analysis)
+
+        return {
+            'total_score': total_score,
+            'word_analysis': word_analysis,
+            'feedback': feedback
+        }
+
     def _clean_and_split_text(self, text):
         """Metni temizler ve kelimelere ayırır"""
         # Noktalama işaretlerini kaldır ve küçük harfe çevir
@@ -67,25 +130,29 @@ class PronunciationAnalyzer:
         for i, (target, segment) in enumerate(zip(target_words, segments)):
             recognized = recognized_words[i] if i < len(recognized_words) else ""
 
-            # Kelime bazlı karşılaştırma yap
-            similarity = SequenceMatcher(None, target, recognized).ratio()
-
             # Ses özelliklerini analiz et
             phonetic_score = self._analyze_phonemes_in_word(target, segment, sample_rate)
 
-            # Kelime için toplam skor hesapla
-            word_score = (similarity + phonetic_score) / 2
-
-            word_analysis.append({
-                'target_word': target,
-                'recognized_word': recognized,
-                'score': word_score,
-                'is_correct': similarity > 0.8,
-                'error_type': self._determine_error_type(target, recognized) if similarity < 0.8 else None
-            })
+            word_analysis.append(self._score_word(target, recognized, phonetic_score))
 
         return word_analysis
 
+    def _score_word(self, target, recognized, phonetic_score):
+        """Tek bir kelimenin metin ve ses skorlarını birleştirir"""
+        # Kelime bazlı karşılaştırma yap
+        similarity = SequenceMatcher(None, target, recognized).ratio()
+
+        # Kelime için toplam skor hesapla
+        word_score = (similarity + phonetic_score) / 2
+
+        return {
+            'target_word': target,
+            'recognized_word': recognized,
+            'score': word_score,
+            'is_correct': similarity > 0.8,
+            'error_type': self._determine_error_type(target, recognized) if similarity < 0.8 else None
+        }
+
     def _segment_audio(self, audio_data, sample_rate, num_words):
         """Ses dosyasını kelime sayısına göre segmentlere ayırır"""
         # Basit olarak eşit parçalara böl
@@ -116,6 +183,76 @@ class PronunciationAnalyzer:
 
         return min(1.0, energy / total_energy)
 
+    def _batch_band_ratios(self, segments, sample_rates, batch_size, max_batch_samples, n_fft=2048):
+        """
+        Tüm segmentler için fonem frekans aralıklarının enerji oranlarını hesaplar.
+        Segmentler örnekleme hızı ve uzunluk kovasına göre gruplanır, sıfırla
+        doldurulur ve her grup tek bir STFT çağrısıyla işlenir. Dolgudan gelen
+        çerçeveler maskelenir; sonuç _check_frequency_range ile aynıdır.
+        Bir STFT çağrısındaki segment sayısı batch_size ile, dolgulu toplam örnek
+        sayısı max_batch_samples ile sınırlıdır (bütçeden uzun segment tek başına işlenir).
+        Dönüş: (segment sayısı, fonem sayısı) boyutlu dizi.
+        """
+        hop_length = n_fft // 4
+        ratios = np.zeros((len(segments), len(self.turkish_phonemes)))
+
+        # Segmentleri (örnekleme hızı, kova uzunluğu) anahtarına göre grupla
+        buckets = {}
+        for index, (segment, sr) in enumerate(zip(segments, sample_rates)):
+            bucket_length = max(n_fft, 1 << int(np.ceil(np.log2(max(len(segment), 1)))))
+            buckets.setdefault((sr, bucket_length), []).append(index)
+
+        for (sr, bucket_length), indices in buckets.items():
+            lower_bins, upper_bins = self._phoneme_band_bins(sr, n_fft)
+
+            # Uzun kovalarda bellek bütçesini aşmamak için satır sayısını azalt
+            rows = max(1, min(batch_size, max_batch_samples // bucket_length))
+
+            for start in range(0, len(indices), rows):
+                chunk = indices[start:start + rows]
+
+                # Segmentleri aynı uzunluğa doldur
+                batch = np.zeros((len(chunk), bucket_length), dtype=np.float32)
+                valid_frames = np.empty(len(chunk), dtype=np.int64)
+                for row, index in enumerate(chunk):
+                    segment = segments[index]
+                    batch[row, :len(segment)] = segment
+                    valid_frames[row] = 1 + len(segment) // hop_length
+
+                spectrogram = np.abs(librosa.stft(batch, n_fft=n_fft, hop_length=hop_length))
+
+                # Dolgu çerçevelerini dışarıda bırakarak frekans bazlı enerji topla
+                frame_mask = np.arange(spectrogram.shape[-1]) < valid_frames[:, None]
+                bin_energy = np.einsum('bft,bt->bf', spectrogram, frame_mask.astype(spectrogram.dtype))
+
+                # Kümülatif toplam ile tüm fonem aralıklarının ortalaması
+                cumulative = np.concatenate(
+                    [np.zeros((len(chunk), 1)), np.cumsum(bin_energy, axis=1, dtype=np.float64)],
+                    axis=1
+                )
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    band_mean = (cumulative[:, upper_bins] - cumulative[:, lower_bins]) / (upper_bins - lower_bins)
+                    total_mean = cumulative[:, -1:] / bin_energy.shape[1]
+                    ratio = band_mean / total_mean
+
+                # min(1.0, oran) ile aynı davranış (NaN -> 1.0)
+                ratios[chunk] = np.where(ratio < 1.0, ratio, 1.0)
+
+        return ratios
+
+    def _phoneme_band_bins(self, sr, n_fft):
+        """Fonem frekans aralıklarının STFT bin sınırlarını döndürür"""
+        freq_bins = librosa.fft_frequencies(sr=sr, n_fft=n_fft)
+        ranges = np.array([p['frequency_range'] for p in self.turkish_phonemes.values()])
+        lower_bins = np.searchsorted(freq_bins, ranges[:, 0])
+        upper_bins = np.searchsorted(freq_bins, ranges[:, 1])
+        return lower_bins, upper_bins
+
+    def _phonetic_score_from_bands(self, word, band_ratios):
+        """Önceden hesaplanmış enerji oranlarından kelimenin ses skorunu hesaplar"""
+        scores = [band_ratios[self.phoneme_index[char]] for char in word if char in self.phoneme_index]
+        return np.mean(scores) if scores else 0.5
+
     def _determine_error_type(self, target, recognized):
         """Telaffuz hatasının türünü belirler"""
         if not recognized:
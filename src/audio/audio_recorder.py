@@ -5,20 +5,25 @@ import numpy as np
 import wave
 import threading
 from datetime import datetime
+from src.audio.level_buffer import LevelBuffer
 
 
 class AudioRecorder:
-    def __init__(self):
+    def __init__(self, archive=None):
         self.sample_rate = 44100  # Örnekleme hızı
         self.channels = 1  # Mono ses kaydı
         self.recording = False  # Kayıt durumu
         self.frames = []  # Ses verilerini tutacak liste
+        self.archive = archive  # Verilirse kayıtlar sıkıştırılmış arşive yazılır
+        # Canlı seviye göstergesi ve dalga formu için indirgenmiş veri
+        self.level_buffer = LevelBuffer(samples_per_column=self.sample_rate // 100)
 
     def start_recording(self):
         """Ses kaydını başlatır"""
         if not self.recording:
             self.recording = True
             self.frames = []
+            self.level_buffer.reset()
             self.audio_thread = threading.Thread(target=self._record)
             self.audio_thread.start()
 
@@ -34,6 +39,7 @@ class AudioRecorder:
         def callback(indata, frames, time, status):
             if self.recording:
                 self.frames.append(indata.copy())
+                self.level_buffer.push(indata[:, 0])
 
         with sd.InputStream(samplerate=self.sample_rate,
                             channels=self.channels,
@@ -42,10 +48,17 @@ class AudioRecorder:
                 sd.sleep(100)
 
     def save_recording(self, filename=None):
-        """Kaydedilen sesi WAV dosyası olarak kaydeder"""
+        """
+        Kaydedilen sesi kaydeder.
+        Arşiv tanımlıysa ve dosya adı verilmemişse FLAC olarak arşive,
+        aksi halde WAV dosyası olarak yazar.
+        """
         if not self.frames:
             return None
 
+        if self.archive is not None and filename is None:
+            return self.archive.add(np.concatenate(self.frames), self.sample_rate)
+
         if filename is None:
             filename = f"kayit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.wav"
 
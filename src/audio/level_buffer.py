@@ -0,0 +1,165 @@
+# src/audio/level_buffer.py
+"""
+Kayıt sırasında canlı seviye göstergesi ve dalga formu için veri tutar.
+Ses geri çağrısından gelen örnekleri sütun başına min/maks değerlerine indirger
+ve sabit boyutlu bir halka tamponda saklar. Tek yazıcı (ses geri çağrısı) ve tek
+okuyucu (arayüz zamanlayıcısı) için kilitsiz çalışır; çalışma sırasında bellek ayırmaz.
+"""
+
+import numpy as np
+
+
+class LevelBuffer:
+    def __init__(self, capacity=2048, samples_per_column=441, clip_threshold=0.99):
+        self.capacity = capacity  # Halka tamponda tutulan sütun sayısı
+        self.samples_per_column = samples_per_column  # Bir sütuna düşen örnek sayısı
+        self.clip_threshold = clip_threshold  # Kırpılma kabul edilen genlik
+
+        # Halka tampon (sütun başına min/maks)
+        self._mins = np.zeros(capacity, dtype=np.float32)
+        self._maxs = np.zeros(capacity, dtype=np.float32)
+
+        # Blok bazlı indirgeme için ara tamponlar
+        self._block_mins = np.zeros(capacity, dtype=np.float32)
+        self._block_maxs = np.zeros(capacity, dtype=np.float32)
+
+        self.reset()
+
+    def reset(self):
+        """Tamponu yeni bir kayıt için sıfırlar"""
+        self._mins.fill(0.0)
+        self._maxs.fill(0.0)
+        self._partial_min = 0.0
+        self._partial_max = 0.0
+        self._partial_fill = 0
+        self.clip_count = 0  # Kırpılan blok sayısı (yalnızca yazıcı günceller)
+        # Yazılan toplam sütun sayısı; okuyucu yalnızca bu değeri izler
+        self.columns_written = 0
+        # Tepe seviyesinin en son okunduğu sütun (yalnızca okuyucu günceller)
+        self._peak_position = 0
+
+    def push(self, samples):
+        """Ses geri çağrısından gelen tek kanallı örnekleri tampona ekler"""
+        n = len(samples)
+        if n == 0:
+            return
+
+        level = max(float(samples.max()), -float(samples.min()))
+        if level >= self.clip_threshold:
+            self.clip_count += 1
+
+        spc = self.samples_per_column
+        pos = 0
+
+        # Önceki bloktan kalan yarım sütunu tamamla
+        if self._partial_fill:
+            take = min(spc - self._partial_fill, n)
+            head = samples[:take]
+            self._partial_min = min(self._partial_min, float(head.min()))
+            self._partial_max = max(self._partial_max, float(head.max()))
+            self._partial_fill += take
+            pos = take
+            if self._partial_fill == spc:
+                self._write_column(self._partial_min, self._partial_max)
+                self._partial_fill = 0
+
+        # Tam sütunları tek seferde indirge
+        full = (n - pos) // spc
+        skipped = 0
+        if full > self.capacity:
+            # Tampondan uzun bloklarda yalnızca son sütunlar saklanır
+            skipped = full - self.capacity
+            pos += skipped * spc
+            full = self.capacity
+        if full:
+            block = samples[pos:pos + full * spc].reshape(full, spc)
+            np.min(block, axis=1, out=self._block_mins[:full])
+            np.max(block, axis=1, out=self._block_maxs[:full])
+            self._write_columns(full, skipped)
+            pos += full * spc
+
+        # Artan örnekleri yarım sütun olarak sakla
+        if pos < n:
+            tail = samples[pos:]
+            if self._partial_fill:
+                self._partial_min = min(self._partial_min, float(tail.min()))
+                self._partial_max = max(self._partial_max, float(tail.max()))
+            else:
+                self._partial_min = float(tail.min())
+                self._partial_max = float(tail.max())
+            self._partial_fill += n - pos
+
+    def _write_column(self, col_min, col_max):
+        """Tek bir sütunu halka tampona yazar"""
+        index = self.columns_written % self.capacity
+        self._mins[index] = col_min
+        self._maxs[index] = col_max
+        self.columns_written += 1
+
+    def _write_columns(self, count, skipped=0):
+        """Ara tampondaki sütunları, atlanan sütunlardan sonraki konumdan itibaren yazar"""
+        start = (self.columns_written + skipped) % self.capacity
+        first = min(count, self.capacity - start)
+        self._mins[start:start + first] = self._block_mins[:first]
+        self._maxs[start:start + first] = self._block_maxs[:first]
+        if first < count:
+            rest = count - first
+            self._mins[:rest] = self._block_mins[first:count]
+            self._maxs[:rest] = self._block_maxs[first:count]
+        # Sayaç veriler yazıldıktan sonra tek seferde güncellenir
+        self.columns_written += skipped + count
+
+    def read_columns(self, out_mins, out_maxs):
+        """
+        Son sütunları önceden ayrılmış dizilere kopyalar.
+        Dizilerin sonu en yeni sütuna karşılık gelir; henüz yazılmamış
+        sütunlar sıfırla doldurulur. Geçerli sütun sayısını döndürür.
+        """
+        width = min(len(out_mins), len(out_maxs))
+        written = self.columns_written
+        valid = min(width, self.capacity, written)
+        dest = width - valid
+
+        if dest:
+            out_mins[:dest] = 0.0
+            out_maxs[:dest] = 0.0
+
+        if valid:
+            end = written % self.capacity
+            start = (end - valid) % self.capacity
+            if start < end:
+                out_mins[dest:width] = self._mins[start:end]
+                out_maxs[dest:width] = self._maxs[start:end]
+            else:
+                first = self.capacity - start
+                out_mins[dest:dest + first] = self._mins[start:]
+                out_maxs[dest:dest + first] = self._maxs[start:]
+                out_mins[dest + first:width] = self._mins[:end]
+                out_maxs[dest + first:width] = self._maxs[:end]
+
+        return valid
+
+    def take_peak(self):
+        """
+        Son okumadan bu yana yazılan sütunlardaki tepe genliği döndürür.
+        Yalnızca okuyucu tarafından çağrılır. Değer yazıcının doldurduğu min/maks
+        sütunlarından hesaplanır, bu yüzden iki iş parçacığı aynı alana yazmaz ve
+        okumalar arasında gelen tepeler kaybolmaz.
+        """
+        written = self.columns_written
+        start = max(self._peak_position, written - self.capacity)
+        self._peak_position = written
+        if start >= written:
+            return 0.0
+
+        first = start % self.capacity
+        end = written % self.capacity
+        if first < end:
+            peak_max = float(self._maxs[first:end].max())
+            peak_min = float(self._mins[first:end].min())
+        else:
+            peak_max = max(float(self._maxs[first:].max()),
+                           float(self._maxs[:end].max()) if end else -1.0)
+            peak_min = min(float(self._mins[first:].min()),
+                           float(self._mins[:end].min()) if end else 1.0)
+        return max(0.0, peak_max, -peak_min)
@@ -0,0 +1,162 @@
+# src/audio/recording_archive.py
+"""
+Kayıtları sıkıştırılmış olarak arşivler.
+Kayıtlar 16 kHz FLAC olarak data/recordings altına yazılır; yanında süre, özet
+(hash) ve sesli bölgeleri tutan küçük bir index.json dosyası bulunur.
+FLAC dosyaları aranabilir olduğundan, bir kelimenin aralığı gibi belirli bir
+zaman dilimi dosyanın tamamı açılmadan okunabilir.
+"""
+
+import os
+import json
+import hashlib
+from datetime import datetime
+import numpy as np
+import soundfile as sf
+import librosa
+
+
+class RecordingArchive:
+    def __init__(self, root="data/recordings", sample_rate=16000):
+        self.root = root  # Arşiv klasörü
+        self.sample_rate = sample_rate  # Arşivdeki kayıtların örnekleme hızı
+        self.index_path = os.path.join(root, "index.json")
+
+        os.makedirs(root, exist_ok=True)
+        self.index = self._load_index()
+
+    def _load_index(self):
+        """Dizin dosyasını okur, yoksa boş dizin döndürür"""
+        if not os.path.exists(self.index_path):
+            return {}
+
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_index(self):
+        """Dizin dosyasını yarım yazılmış dosya kalmayacak şekilde kaydeder"""
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.index_path)
+
+    def add(self, audio_data, sample_rate, name=None, overwrite=False):
+        """
+        Ses verisini FLAC olarak arşive ekler ve dizini günceller.
+        Ad verilmezse çakışmayan bir ad üretilir. Verilen ad klasör içermemelidir;
+        uzantısı yoksa .flac eklenir, başka bir uzantı varsa ValueError fırlatılır.
+        Ad arşivde zaten varsa overwrite=True olmadıkça FileExistsError fırlatılır.
+        Arşivdeki dosyanın yolunu döndürür.
+        """
+        if name is None:
+            name = self._unique_name()
+        else:
+            name = self._check_name(name)
+
+        if not overwrite and self._exists(name):
+            raise FileExistsError(f"'{name}' kaydı arşivde zaten var.")
+
+        audio_data = np.asarray(audio_data, dtype=np.float32).reshape(-1)
+
+        # Örnekleme hızını dönüştür
+        if sample_rate != self.sample_rate:
+            audio_data = librosa.resample(audio_data, orig_sr=sample_rate, target_sr=self.sample_rate)
+
+        path = self.path_of(name)
+        sf.write(path, np.clip(audio_data, -1.0, 1.0), self.sample_rate,
+                 format="FLAC", subtype="PCM_16")
+
+        self.index[name] = {
+            'duration': len(audio_data) / self.sample_rate,
+            'sample_rate': self.sample_rate,
+            'sha256': self._file_hash(path),
+            'voiced_regions': self._voiced_regions(audio_data),
+            'created': datetime.now().isoformat(timespec='seconds')
+        }
+        self._save_index()
+
+        return path
+
+    def _check_name(self, name):
+        """Verilen adın arşiv klasöründe kalan bir FLAC dosya adı olduğunu doğrular"""
+        if (not name or name.startswith('.') or '/' in name or '\\' in name
+                or os.path.basename(name) != name):
+            raise ValueError(f"Geçersiz kayıt adı: '{name}'")
+
+        extension = os.path.splitext(name)[1]
+        if not extension:
+            return f"{name}.flac"
+        if extension.lower() != '.flac':
+            raise ValueError(f"Kayıt adı .flac uzantılı olmalı: '{name}'")
+
+        return name
+
+    def _exists(self, name):
+        """Adın dizinde veya diskte kullanılıp kullanılmadığını kontrol eder"""
+        return name in self.index or os.path.exists(self.path_of(name))
+
+    def _unique_name(self):
+        """Zaman damgasından mikrosaniye hassasiyetinde, çakışmayan bir ad üretir"""
+        base = f"kayit_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        name = f"{base}.flac"
+        counter = 1
+        while self._exists(name):
+            name = f"{base}_{counter}.flac"
+            counter += 1
+        return name
+
+    def get_entry(self, name):
+        """Kaydın dizin bilgisini döndürür"""
+        return self.index.get(name)
+
+    def path_of(self, name):
+        """Kaydın arşivdeki yolunu döndürür"""
+        return os.path.join(self.root, name)
+
+    def read(self, name, start=None, end=None):
+        """
+        Kaydın yalnızca istenen zaman aralığını (saniye) çözer.
+        (ses verisi, örnekleme hızı) döndürür.
+        """
+        with sf.SoundFile(self.path_of(name)) as f:
+            sr = f.samplerate
+            start_frame = int(round(start * sr)) if start else 0
+            end_frame = int(round(end * sr)) if end is not None else f.frames
+
+            start_frame = max(0, min(start_frame, f.frames))
+            end_frame = max(start_frame, min(end_frame, f.frames))
+
+            f.seek(start_frame)
+            audio_data = f.read(end_frame - start_frame, dtype="float32")
+
+        return audio_data, sr
+
+    def read_voiced_region(self, name, region_index):
+        """Dizindeki sesli bölgelerden birini okur"""
+        start, end = self.index[name]['voiced_regions'][region_index]
+        return self.read(name, start, end)
+
+    def verify(self, name):
+        """Dosyanın özetinin dizindekiyle eşleşip eşleşmediğini kontrol eder"""
+        entry = self.get_entry(name)
+        return entry is not None and entry['sha256'] == self._file_hash(self.path_of(name))
+
+    def _file_hash(self, path):
+        """Dosyanın SHA-256 özetini hesaplar"""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _voiced_regions(self, audio_data):
+        """Sesli bölgeleri saniye cinsinden [başlangıç, bitiş] listesi olarak bulur"""
+        if not len(audio_data):
+            return []
+
+        intervals = librosa.effects.split(audio_data,
+                                          top_db=30,
+                                          frame_length=1024,
+                                          hop_length=256)
+        return [[round(start / self.sample_rate, 3), round(end / self.sample_rate, 3)]
+                for start, end in intervals]
@@ -5,6 +5,7 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QTextEdit, QScrollArea, QFrame)
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont, QColor, QTextCharFormat, QTextCursor
+from src.gui.widgets import LevelMeterWidget, WaveformWidget
 import os
 
 
@@ -107,6 +108,15 @@ class MainWindow(QMainWindow):
         self.duration_label.hide()
         main_layout.addWidget(self.duration_label)
 
+        # Canlı seviye göstergesi ve dalga formu
+        self.level_meter = LevelMeterWidget()
+        self.level_meter.hide()
+        main_layout.addWidget(self.level_meter)
+
+        self.waveform_view = WaveformWidget(capacity=self.audio_recorder.level_buffer.capacity)
+        self.waveform_view.hide()
+        main_layout.addWidget(self.waveform_view)
+
         # İlerleme çubuğu
         self.progress_bar = QProgressBar()
         self.progress_bar.hide()
@@ -151,6 +161,10 @@ class MainWindow(QMainWindow):
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_duration)
 
+        # Seviye göstergesi zamanlayıcısı (~30 fps)
+        self.level_timer = QTimer()
+        self.level_timer.timeout.connect(self.update_level_view)
+
     def update_target_text(self):
         """Hedef metin değiştiğinde butonları günceller"""
         text = self.text_input.toPlainText().strip()
@@ -187,10 +201,15 @@ class MainWindow(QMainWindow):
         self.text_input.setEnabled(False)
         self.recording_duration = 0
         self.duration_label.show()
+        self.level_meter.reset()
+        self.level_meter.show()
+        self.waveform_view.reset()
+        self.waveform_view.show()
         self.clear_results()
 
         self.audio_recorder.start_recording()
         self.timer.start(1000)
+        self.level_timer.start(33)
         self.is_recording = True
 
     def stop_recording(self):
@@ -211,6 +230,7 @@ class MainWindow(QMainWindow):
         self.file_button.setEnabled(True)
         self.text_input.setEnabled(True)
         self.timer.stop()
+        self.level_timer.stop()
         self.audio_recorder.stop_recording()
 
         filename = self.audio_recorder.save_recording()
@@ -219,6 +239,8 @@ class MainWindow(QMainWindow):
 
         self.is_recording = False
         self.duration_label.hide()
+        self.level_meter.hide()
+        self.waveform_view.hide()
 
     def select_file(self):
         """Ses dosyası seçme penceresini açar"""
@@ -226,7 +248,7 @@ class MainWindow(QMainWindow):
             self,
             "Ses Dosyası Seç",
             "",
-            "Ses Dosyaları (*.wav)"
+            "Ses Dosyaları (*.wav *.flac)"
         )
         if filename:
             self.clear_results()
@@ -239,6 +261,12 @@ class MainWindow(QMainWindow):
         seconds = self.recording_duration % 60
         self.duration_label.setText(f"Kayıt Süresi: {minutes}:{seconds:02d}")
 
+    def update_level_view(self):
+        """Canlı seviye göstergesini ve dalga formunu günceller"""
+        level_buffer = self.audio_recorder.level_buffer
+        self.level_meter.set_level(level_buffer.take_peak(), level_buffer.clip_count > 0)
+        self.waveform_view.refresh(level_buffer)
+
     def clear_results(self):
         """Sonuç alanlarını temizler"""
         self.recognized_text_label.setText("")
@@ -0,0 +1,140 @@
+# src/gui/widgets.py
+"""
+Kayıt sırasında kullanılan canlı seviye göstergesi ve kayan dalga formu widget'ları.
+Veriler AudioRecorder'ın LevelBuffer'ından okunur; çizim için gereken diziler ve
+çizgi nesneleri önceden ayrılır, böylece her karede yeni bellek ayrılmaz.
+"""
+
+import math
+import numpy as np
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import QLineF, QRectF
+from PyQt5.QtGui import QPainter, QColor, QPen
+
+
+class LevelMeterWidget(QWidget):
+    def __init__(self, parent=None, min_db=-60.0):
+        super().__init__(parent)
+        self.min_db = min_db  # Göstergenin alt sınırı (dBFS)
+        self.level_db = min_db  # Anlık seviye
+        self.hold_db = min_db  # Tepe tutma seviyesi
+        self.clipped = False  # Kayıt boyunca kırpılma oldu mu
+
+        self.setMinimumHeight(18)
+        self.setMaximumHeight(18)
+
+    def reset(self):
+        """Göstergeyi yeni kayıt için sıfırlar"""
+        self.level_db = self.min_db
+        self.hold_db = self.min_db
+        self.clipped = False
+        self.update()
+
+    def set_level(self, peak, clipped=False):
+        """Tepe genliği (0-1) dBFS'e çevirip göstergeyi günceller"""
+        level_db = 20 * math.log10(peak) if peak > 0 else self.min_db
+        self.level_db = max(self.min_db, min(0.0, level_db))
+        # Tepe tutma yavaşça düşer
+        self.hold_db = max(self.level_db, self.hold_db - 0.5)
+        self.clipped = self.clipped or clipped
+        self.update()
+
+    def _db_to_x(self, db, width):
+        """dBFS değerini piksel konumuna çevirir"""
+        return width * (db - self.min_db) / -self.min_db
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        width = self.width() - 20  # Sağda kırpılma göstergesi için yer bırak
+        height = self.height()
+
+        painter.fillRect(0, 0, self.width(), height, QColor("#ecf0f1"))
+
+        # Seviye çubuğu: -12 dB'e kadar yeşil, -3 dB'e kadar sarı, üstü kırmızı
+        level_x = self._db_to_x(self.level_db, width)
+        segments = ((self.min_db, -12.0, "#2ecc71"), (-12.0, -3.0, "#f1c40f"), (-3.0, 0.0, "#e74c3c"))
+        for low_db, high_db, color in segments:
+            start_x = self._db_to_x(low_db, width)
+            end_x = min(level_x, self._db_to_x(high_db, width))
+            if end_x > start_x:
+                painter.fillRect(QRectF(start_x, 0, end_x - start_x, height), QColor(color))
+
+        # Tepe tutma çizgisi
+        hold_x = self._db_to_x(self.hold_db, width)
+        painter.setPen(QPen(QColor("#2c3e50"), 2))
+        painter.drawLine(QLineF(hold_x, 0, hold_x, height))
+
+        # Kırpılma göstergesi
+        clip_color = "#e74c3c" if self.clipped else "#bdc3c7"
+        painter.fillRect(self.width() - 16, 2, 14, height - 4, QColor(clip_color))
+
+
+class WaveformWidget(QWidget):
+    def __init__(self, parent=None, capacity=2048):
+        super().__init__(parent)
+        # Halka tampondan okunan sütunlar ve çizim için ara diziler
+        self._mins = np.zeros(capacity, dtype=np.float32)
+        self._maxs = np.zeros(capacity, dtype=np.float32)
+        self._top = np.zeros(capacity, dtype=np.float32)
+        self._bottom = np.zeros(capacity, dtype=np.float32)
+        self._lines = [QLineF() for _ in range(capacity)]
+        self._visible_lines = []  # drawLines'a verilen liste; yalnızca sütun sayısı değişince yenilenir
+        self._center_line = QLineF()
+        self._valid = 0
+
+        self._pen = QPen(QColor("#3498db"))
+        self._pen.setWidth(1)
+        self._center_pen = QPen(QColor("#bdc3c7"))
+
+        self.setMinimumHeight(80)
+
+    def reset(self):
+        """Dalga formunu temizler"""
+        self._mins.fill(0.0)
+        self._maxs.fill(0.0)
+        self._valid = 0
+        self.update()
+
+    def refresh(self, level_buffer):
+        """LevelBuffer'daki son sütunları okuyup yeniden çizim ister"""
+        self._valid = level_buffer.read_columns(self._mins, self._maxs)
+        self.update()
+
+    def resizeEvent(self, event):
+        half = self.height() / 2
+        self._center_line.setLine(0, half, self.width(), half)
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        width = min(self.width(), len(self._lines))
+        half = self.height() / 2
+
+        painter.fillRect(self.rect(), QColor("#ffffff"))
+        painter.setPen(self._center_pen)
+        painter.drawLine(self._center_line)
+
+        count = min(width, self._valid)
+        if not count:
+            return
+
+        # Her piksel sütunu için min/maks arasında dikey çizgi
+        first = len(self._mins) - count
+        top = self._top[:count]
+        bottom = self._bottom[:count]
+        np.multiply(self._maxs[first:], -half, out=top)
+        np.add(top, half, out=top)
+        np.multiply(self._mins[first:], -half, out=bottom)
+        np.add(bottom, half, out=bottom)
+
+        offset = self.width() - count
+        lines = self._lines
+        for i in range(count):
+            x = offset + i
+            lines[i].setLine(x, top[i], x, bottom[i] + 1)
+
+        if len(self._visible_lines) != count:
+            self._visible_lines = lines[:count]
+
+        painter.setPen(self._pen)
+        painter.drawLines(self._visible_lines)
@@ -0,0 +1,63 @@
+# tests/test_analysis.py
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import soundfile as sf
+from src.analysis.pronunciation_analyzer import PronunciationAnalyzer
+
+
+class TestBatchAnalysis(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.analyzer = PronunciationAnalyzer()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def _write(self, name, duration, sample_rate, frequency):
+        """Kısa sentetik bir kayıt yazar"""
+        rng = np.random.default_rng(len(name))
+        t = np.arange(int(duration * sample_rate)) / sample_rate
+        y = 0.3 * np.sin(2 * np.pi * frequency * t) + 0.05 * rng.standard_normal(len(t))
+        path = os.path.join(self.folder, name)
+        sf.write(path, y.astype(np.float32), sample_rate)
+        return path
+
+    def test_batch_matches_single(self):
+        items = [
+            (self._write("a.wav", 2.0, 44100, 440), "merhaba benim adım ismail", "merhaba benim adım ismail"),
+            (self._write("b.wav", 1.2, 16000, 650), "bugün hava güzel", "bugun hava guzel"),
+            # n_fft'ten kısa segmentler
+            (self._write("c.wav", 0.1, 16000, 300), "okul otobüs öğrenci", "okul otobüs"),
+            # Boş tanınan metin ve okunamayan dosya
+            (self._write("d.wav", 1.0, 22050, 500), "merhaba", ""),
+            (os.path.join(self.folder, "yok.wav"), "merhaba", "merhaba"),
+        ]
+
+        single = [self.analyzer.analyze_pronunciation(*item) for item in items]
+        batch = self.analyzer.analyze_pronunciation_batch(items, batch_size=2, max_batch_samples=1 << 15)
+
+        self.assertEqual(len(single), len(batch))
+        self.assertIsNone(single[3])
+        self.assertIsNone(batch[3])
+        self.assertIsNone(batch[4])
+
+        for expected, actual in zip(single, batch):
+            if expected is None:
+                self.assertIsNone(actual)
+                continue
+
+            self.assertAlmostEqual(expected['total_score'], actual['total_score'], places=5)
+            self.assertEqual(expected['feedback'], actual['feedback'])
+            self.assertEqual(len(expected['word_analysis']), len(actual['word_analysis']))
+            for exp_word, act_word in zip(expected['word_analysis'], actual['word_analysis']):
+                self.assertAlmostEqual(exp_word['score'], act_word['score'], places=5)
+                for key in ('target_word', 'recognized_word', 'is_correct', 'error_type'):
+                    self.assertEqual(exp_word[key], act_word[key])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,235 @@
+# tests/test_audio.py
+
+import os
+import wave
+import shutil
+import hashlib
+import tempfile
+import unittest
+import numpy as np
+import soundfile as sf
+from src.audio.level_buffer import LevelBuffer
+from src.audio.recording_archive import RecordingArchive
+
+try:
+    from src.audio.audio_recorder import AudioRecorder
+except (ImportError, OSError):  # sounddevice veya PortAudio kurulu değil
+    AudioRecorder = None
+
+
+class TestLevelBuffer(unittest.TestCase):
+    def _reference(self, samples, spc, width):
+        """Tüm örneklerden sütun başına min/maks değerlerini doğrudan hesaplar"""
+        full = len(samples) // spc
+        columns = samples[:full * spc].reshape(full, spc)
+        mins = np.zeros(width, dtype=np.float32)
+        maxs = np.zeros(width, dtype=np.float32)
+        valid = min(width, full)
+        if valid:
+            mins[width - valid:] = columns.min(axis=1)[full - valid:]
+            maxs[width - valid:] = columns.max(axis=1)[full - valid:]
+        return mins, maxs, valid
+
+    def test_read_columns_matches_reference(self):
+        rng = np.random.default_rng(0)
+        for capacity, spc, max_block in ((16, 10, 25), (16, 10, 400), (32, 7, 300)):
+            level_buffer = LevelBuffer(capacity=capacity, samples_per_column=spc)
+            pushed = []
+            for _ in range(200):
+                block = rng.uniform(-1, 1, rng.integers(1, max_block)).astype(np.float32)
+                level_buffer.push(block)
+                pushed.append(block)
+
+                samples = np.concatenate(pushed)
+                for width in (capacity // 2, capacity, capacity + 5):
+                    out_mins = np.ones(width, dtype=np.float32)
+                    out_maxs = np.ones(width, dtype=np.float32)
+                    valid = level_buffer.read_columns(out_mins, out_maxs)
+
+                    ref_mins, ref_maxs, ref_valid = self._reference(
+                        samples, spc, min(width, capacity))
+                    self.assertEqual(valid, ref_valid)
+                    np.testing.assert_array_equal(out_mins[width - len(ref_mins):], ref_mins)
+                    np.testing.assert_array_equal(out_maxs[width - len(ref_maxs):], ref_maxs)
+                    np.testing.assert_array_equal(out_mins[:width - len(ref_mins)], 0.0)
+
+            self.assertEqual(level_buffer.columns_written,
+                             sum(len(b) for b in pushed) // spc)
+
+    def test_peak_and_clip(self):
+        level_buffer = LevelBuffer(capacity=8, samples_per_column=4)
+        level_buffer.push(np.array([0.1, -0.5, 0.2], dtype=np.float32))
+        # Yarım sütun henüz tepe seviyesine katılmaz
+        self.assertEqual(level_buffer.take_peak(), 0.0)
+
+        level_buffer.push(np.array([0.3, 0.0, 0.2, 0.1, 0.0], dtype=np.float32))
+        self.assertAlmostEqual(level_buffer.take_peak(), 0.5)
+        self.assertEqual(level_buffer.take_peak(), 0.0)
+        self.assertEqual(level_buffer.clip_count, 0)
+
+        level_buffer.push(np.array([1.0, 0.0, 0.0, 0.0], dtype=np.float32))
+        self.assertEqual(level_buffer.clip_count, 1)
+
+        level_buffer.reset()
+        self.assertEqual(level_buffer.columns_written, 0)
+        self.assertEqual(level_buffer.clip_count, 0)
+
+    def test_peak_survives_between_reads(self):
+        rng = np.random.default_rng(1)
+        level_buffer = LevelBuffer(capacity=16, samples_per_column=10)
+        pushed = []
+        last = 0
+        for _ in range(100):
+            # Okumalar arasında birden fazla blok, bazen tampondan uzun
+            for _ in range(rng.integers(1, 4)):
+                block = rng.uniform(-0.5, 0.5, rng.integers(1, 250)).astype(np.float32)
+                block[rng.integers(len(block))] = rng.uniform(-1, 1)
+                level_buffer.push(block)
+                pushed.append(block)
+
+            samples = np.concatenate(pushed)
+            written = len(samples) // 10
+            start = max(last, written - 16)
+            last = written
+            expected = np.abs(samples[start * 10:written * 10]).max() if written > start else 0.0
+            self.assertAlmostEqual(level_buffer.take_peak(), expected, places=6)
+
+class TestRecordingArchive(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.archive = RecordingArchive(root=self.folder)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_default_names_do_not_collide(self):
+        first = self.archive.add(np.full(3 * 16000, 0.1, dtype=np.float32), 16000)
+        second = self.archive.add(np.zeros(16000, dtype=np.float32), 16000)
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(len(self.archive.index), 2)
+        self.assertEqual(self.archive.get_entry(os.path.basename(first))['duration'], 3.0)
+
+    def test_explicit_name_is_not_overwritten(self):
+        self.archive.add(np.zeros(16000, dtype=np.float32), 16000, name="kelime.flac")
+        with self.assertRaises(FileExistsError):
+            self.archive.add(np.zeros(800, dtype=np.float32), 16000, name="kelime.flac")
+        self.assertEqual(self.archive.get_entry("kelime.flac")['duration'], 1.0)
+
+        self.archive.add(np.zeros(800, dtype=np.float32), 16000, name="kelime.flac", overwrite=True)
+        self.assertEqual(self.archive.get_entry("kelime.flac")['duration'], 0.05)
+
+
+    def _tone(self, duration, sample_rate=16000, frequency=440):
+        t = np.arange(int(duration * sample_rate)) / sample_rate
+        return (0.5 * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+    def test_read_range_matches_full_decode(self):
+        rng = np.random.default_rng(0)
+        path = self.archive.add(rng.uniform(-0.5, 0.5, 32000).astype(np.float32), 16000)
+        name = os.path.basename(path)
+        full, sr = self.archive.read(name)
+        self.assertEqual(sr, 16000)
+        self.assertEqual(len(full), 32000)
+
+        cases = [
+            ((0.25, 0.75), full[4000:12000]),
+            ((1.5, None), full[24000:]),
+            ((None, 0.5), full[:8000]),
+            ((-1.0, 0.1), full[:1600]),
+            ((1.9, 5.0), full[30400:]),
+            ((1.0, 0.5), full[:0]),
+            ((3.0, 4.0), full[:0]),
+        ]
+        for (start, end), expected in cases:
+            audio_data, _ = self.archive.read(name, start, end)
+            np.testing.assert_array_equal(audio_data, expected)
+
+    def test_index_fields(self):
+        silence = np.zeros(8000, dtype=np.float32)
+        y = np.concatenate([silence, self._tone(1.0), silence, self._tone(0.5), silence])
+        path = self.archive.add(y, 16000, name="bolgeler")
+        self.assertTrue(path.endswith("bolgeler.flac"))
+        entry = self.archive.get_entry("bolgeler.flac")
+
+        self.assertEqual(entry['sample_rate'], 16000)
+        self.assertAlmostEqual(entry['duration'], 3.0)
+        with open(path, "rb") as f:
+            self.assertEqual(entry['sha256'], hashlib.sha256(f.read()).hexdigest())
+
+        # Sessiz: 0-0.5, 1.5-2.0, 2.5-3.0 s
+        regions = entry['voiced_regions']
+        self.assertEqual(len(regions), 2)
+        for (start, end), (exp_start, exp_end) in zip(regions, [(0.5, 1.5), (2.0, 2.5)]):
+            self.assertAlmostEqual(start, exp_start, delta=0.07)
+            self.assertAlmostEqual(end, exp_end, delta=0.07)
+
+        # Dizin diskten yeniden okunabilmeli
+        self.assertEqual(RecordingArchive(root=self.folder).get_entry("bolgeler.flac"), entry)
+
+    def test_resamples_to_archive_rate(self):
+        path = self.archive.add(self._tone(1.0, sample_rate=44100), 44100)
+        info = sf.info(path)
+        self.assertEqual(info.samplerate, 16000)
+        self.assertEqual(info.format, "FLAC")
+        self.assertAlmostEqual(self.archive.get_entry(os.path.basename(path))['duration'], 1.0)
+
+    def test_verify_detects_modified_file(self):
+        path = self.archive.add(self._tone(1.0), 16000)
+        name = os.path.basename(path)
+        self.assertTrue(self.archive.verify(name))
+
+        with open(path, "r+b") as f:
+            f.seek(os.path.getsize(path) // 2)
+            byte = f.read(1)
+            f.seek(-1, os.SEEK_CUR)
+            f.write(bytes([byte[0] ^ 0xFF]))
+        self.assertFalse(self.archive.verify(name))
+        self.assertFalse(self.archive.verify("yok.flac"))
+
+    def test_rejects_unsafe_names(self):
+        for name in ("../disari.flac", "alt/kayit.flac", "alt\\kayit.flac", "..", "kayit.wav", ".flac"):
+            with self.assertRaises(ValueError):
+                self.archive.add(np.zeros(160, dtype=np.float32), 16000, name=name)
+        self.assertEqual(self.archive.index, {})
+        self.assertFalse(os.path.exists(os.path.join(os.path.dirname(self.folder), "disari.flac")))
+
+
+@unittest.skipIf(AudioRecorder is None, "sounddevice/PortAudio kurulu değil")
+class TestAudioRecorderArchive(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def _recorder(self, archive=None):
+        recorder = AudioRecorder(archive=archive)
+        t = np.arange(recorder.sample_rate) / recorder.sample_rate
+        block = (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32).reshape(-1, 1)
+        recorder.frames = [block[:20000], block[20000:]]
+        return recorder
+
+    def test_save_recording_uses_archive(self):
+        archive = RecordingArchive(root=os.path.join(self.folder, "recordings"))
+        path = self._recorder(archive).save_recording()
+
+        self.assertEqual(os.path.dirname(path), archive.root)
+        self.assertTrue(path.endswith(".flac"))
+        info = sf.info(path)
+        self.assertEqual((info.format, info.samplerate), ("FLAC", 16000))
+        self.assertAlmostEqual(archive.get_entry(os.path.basename(path))['duration'], 1.0)
+
+    def test_save_recording_with_filename_writes_wav(self):
+        archive = RecordingArchive(root=os.path.join(self.folder, "recordings"))
+        filename = os.path.join(self.folder, "x.wav")
+        self.assertEqual(self._recorder(archive).save_recording(filename), filename)
+
+        with wave.open(filename, "rb") as wf:
+            self.assertEqual(wf.getframerate(), 44100)
+            self.assertEqual(wf.getnchannels(), 1)
+        self.assertEqual(archive.index, {})
+
+
+if __name__ == '__main__':
+    unittest.main()